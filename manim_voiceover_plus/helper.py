@@ -11,6 +11,9 @@ from pathlib import Path
 from manim import logger
 
 
+BOOKMARK_RE = re.compile(r"<bookmark\s*mark\s*=['\"]\w*[\"']\s*/>")
+
+
 def chunks(lst: list, n: int):
     """Yield successive n-sized chunks from lst."""
     for i in range(0, len(lst), n):
@@ -18,7 +21,7 @@ def chunks(lst: list, n: int):
 
 
 def remove_bookmarks(input: str) -> str:
-    return re.sub("<bookmark\s*mark\s*=['\"]\w*[\"']\s*/>", "", input)
+    return BOOKMARK_RE.sub("", input)
 
 
 def wav2mp3(wav_path, mp3_path=None, remove_wav=True, bitrate="312k"):
@@ -187,9 +187,20 @@ class SpeechService(ABC):
         json_path = os.path.join(cache_dir / DEFAULT_VOICEOVER_CACHE_JSON_FILENAME)
         if os.path.exists(json_path):
             json_data = json.load(open(json_path, "r"))
+            # Prefer entries that have word boundaries, so a bare
+            # pregenerated entry does not shadow a transcribed one and force
+            # re-transcription. Lookups stay pinned to the *earliest* such
+            # entry: _wrap_generate_from_text rescales the audio offsets by
+            # global_speed and re-appends on every call, so returning the
+            # newest entry would rescale the offsets again on each run.
+            first_match = None
             for entry in json_data:
                 if entry["input_data"] == input_data:
-                    return entry
+                    if "word_boundaries" in entry:
+                        return entry
+                    if first_match is None:
+                        first_match = entry
+            return first_match
         return None
 
     def audio_callback(self, audio_path: str, data: dict, **kwargs):
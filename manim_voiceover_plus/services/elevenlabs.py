@@ -1,25 +1,90 @@
+import asyncio
+import hashlib
+import io
+import json
 import os
+import re
 import sys
+import threading
+import time
+import wave
+import weakref
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from dotenv import find_dotenv, load_dotenv
-from manim import logger
+from manim import config, logger
+from pydub import AudioSegment
 
-from manim_voiceover_plus.helper import create_dotenv_file, remove_bookmarks
+from manim_voiceover_plus.defaults import (
+    DEFAULT_VOICEOVER_CACHE_DIR,
+    DEFAULT_VOICEOVER_CACHE_JSON_FILENAME,
+)
+from manim_voiceover_plus.helper import (
+    append_to_json_file,
+    create_dotenv_file,
+    remove_bookmarks,
+)
+from manim_voiceover_plus.modify_audio import get_duration
 from manim_voiceover_plus.services.base import SpeechService
 
 try:
+    import httpx
     from elevenlabs.client import ElevenLabs
-    from elevenlabs import VoiceSettings, save
+    from elevenlabs import VoiceSettings
 except ImportError:
     logger.error(
         'Missing packages. Run `pip install "manim-voiceover-plus[elevenlabs]"` '
         "to use ElevenLabs API."
     )
 
+try:
+    # BLAKE3 is considerably faster than SHA-256 but purely optional;
+    # both produce the same content-addressed naming scheme
+    from blake3 import blake3 as _content_hash
+except ImportError:
+    from hashlib import sha256 as _content_hash
+
+try:
+    # orjson serializes the cache-key dict several times faster than the
+    # stdlib and returns bytes that feed straight into the hasher
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# The voice list rarely changes, so cache it per-process and on disk to
+# avoid one HTTP round-trip per ElevenLabsService instantiation
+_VOICES_CACHE_TTL = 86400  # seconds
+_VOICES_CACHE: Dict[str, Tuple[float, list]] = {}
+
+_CachedVoice = namedtuple("_CachedVoice", ["name", "voice_id"])
+
+# Sentence boundary: terminal punctuation followed by whitespace and an
+# uppercase letter. Common titles and abbreviations are excluded via
+# lookbehinds; decimals never match since they have no whitespace after
+# the period.
+_SENTENCE_SPLIT_RE = re.compile(
+    r"(?<!\b[A-Z]\.)"
+    r"(?<!Dr\.)(?<!Mr\.)(?<!Ms\.)(?<!Mrs\.)(?<!Prof\.)(?<!St\.)"
+    r"(?<!etc\.)(?<!e\.g\.)(?<!i\.e\.)"
+    r"(?<=[.!?])\s+(?=[A-Z])"
+)
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text on sentence boundaries, keeping abbreviations and
+    decimals intact."""
+    return [sentence for sentence in _SENTENCE_SPLIT_RE.split(text) if sentence.strip()]
+
 
-load_dotenv(find_dotenv(usecwd=True))
+def _voices_disk_cache_path() -> Path:
+    return (
+        Path(config.media_dir) / DEFAULT_VOICEOVER_CACHE_DIR / "elevenlabs_voices.json"
+    )
 
 
 def create_dotenv_elevenlabs():
@@ -39,24 +104,28 @@ def create_dotenv_elevenlabs():
         sys.exit()
 
 
-create_dotenv_elevenlabs()
-
-
 class ElevenLabsService(SpeechService):
     """Speech service for ElevenLabs API."""
 
+    # .env discovery walks up the directory tree, so defer it to the first
+    # instantiation instead of paying the filesystem I/O at import time
+    _env_loaded = False
+    _env_lock = threading.Lock()
+
     def __init__(
         self,
         voice_name: Optional[str] = None,
         voice_id: Optional[str] = None,
-        model: str = "eleven_multilingual_v2",
+        model: Optional[str] = None,
         voice_settings: Optional[VoiceSettings] = None,
-        output_format: str = "mp3_44100_128",
+        output_format: str = "pcm_24000",
         enable_logging: Optional[bool] = None,
         optimize_streaming_latency: Optional[int] = None,
         language_code: Optional[str] = None,
         apply_text_normalization: Optional[str] = None,
         apply_language_text_normalization: Optional[bool] = None,
+        stream: bool = True,
+        split_sentences: bool = True,
         transcription_model: str = "base",
         **kwargs,
     ):
@@ -75,36 +144,88 @@ class ElevenLabsService(SpeechService):
                 or `voice_id` must be provided, it uses default available voice.
             model (str, optional): The name of the model to use. See the `API
                 page: <https://elevenlabs.io/docs/api-reference/text-to-speech>`
-                for reference. Defaults to `eleven_multilingual_v2`
+                for reference. Defaults to None, which picks
+                `eleven_flash_v2_5` (noticeably lower latency) for short cues
+                and when a language code is enforced, and
+                `eleven_multilingual_v2` otherwise.
             voice_settings (VoiceSettings, optional): The voice settings to use.
                 Should be a VoiceSettings instance from elevenlabs.
                 See the
                 `Docs: <https://elevenlabs.io/docs/speech-synthesis/voice-settings>`
                 for reference.
-            output_format (str, optional): The voice output format to use. 
-                Options are available depending on the Elevenlabs subscription. 
+            output_format (str, optional): The voice output format to use.
+                Options are available depending on the Elevenlabs subscription.
                 See the `API page:
                 <https://elevenlabs.io/docs/api-reference/text-to-speech>`
-                for reference. Defaults to `mp3_44100_128`.
+                for reference. Defaults to `pcm_24000`. PCM formats are
+                wrapped in a WAV container on disk, which lets playback start
+                with the first chunk and skips the MP3 decode pass when the
+                audio is muxed into the video.
             enable_logging (bool, optional): When enable_logging is set to false 
                 zero retention mode will be used for the request. Defaults to None.
-            optimize_streaming_latency (int, optional): You can turn on latency 
-                optimizations at some cost of quality. Values: 0-4. Defaults to None.
+            optimize_streaming_latency (int, optional): You can turn on latency
+                optimizations at some cost of quality. Values: 0-4. Defaults to
+                None, which selects 3 for low/medium-quality (preview) renders
+                and leaves latency optimizations off for production renders.
+                Note that ElevenLabs has deprecated this parameter, so the
+                API may ignore it.
             language_code (str, optional): Language code (ISO 639-1) used to enforce 
                 a language for the model. Currently only Turbo v2.5 and Flash v2.5 
                 support language enforcement. Defaults to None.
             apply_text_normalization (str, optional): Controls text normalization 
                 with three modes: 'auto', 'on', and 'off'. Defaults to None.
-            apply_language_text_normalization (bool, optional): Controls language 
-                text normalization. Can heavily increase latency. Currently only 
+            apply_language_text_normalization (bool, optional): Controls language
+                text normalization. Can heavily increase latency. Currently only
                 supported for Japanese. Defaults to None.
+            stream (bool, optional): Whether to use the streaming endpoint and
+                write audio chunks to disk as they arrive, instead of buffering
+                the whole file in memory first. Defaults to True.
+            split_sentences (bool, optional): Whether to split multi-sentence
+                texts on sentence boundaries and synthesize the sentences
+                concurrently, passing the surrounding sentences as context
+                for prosody continuity. Defaults to True.
         """
-        # Initialize the ElevenLabs client
+        if not ElevenLabsService._env_loaded:
+            with ElevenLabsService._env_lock:
+                if not ElevenLabsService._env_loaded:
+                    load_dotenv(find_dotenv(usecwd=True))
+                    create_dotenv_elevenlabs()
+                    ElevenLabsService._env_loaded = True
+
+        # Initialize the ElevenLabs client with a persistent connection pool,
+        # so consecutive voiceovers reuse the warm TLS session instead of
+        # paying a TCP+TLS handshake per request
         api_key = os.getenv("ELEVEN_API_KEY")
-        self.client = ElevenLabs(api_key=api_key)
+        httpx_limits = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300)
+        try:
+            self._httpx_client = httpx.Client(http2=True, limits=httpx_limits, timeout=60)
+        except ImportError:
+            # HTTP/2 support needs the optional `h2` package; HTTP/1.1
+            # keep-alive still reuses the connection
+            self._httpx_client = httpx.Client(limits=httpx_limits, timeout=60)
+        self.client = ElevenLabs(api_key=api_key, httpx_client=self._httpx_client)
         
         # Initialize consecutive text tracking dictionary
         self.consecutive_text_by_id: Dict[str, str] = {}
+
+        # Last cue's (request_id, text), threaded into the next request for
+        # ElevenLabs' request-stitching prosody path. Stored as one tuple so
+        # reads and writes are atomic across prefetch worker threads; the
+        # request_id is None whenever the last cue resolved from the cache,
+        # since a stale ID would mismatch the accompanying text.
+        self._stitch_context: Optional[Tuple[Optional[str], str]] = None
+
+        # Memoized results keyed by the raw call arguments, so repeated
+        # renders skip bookmark stripping, Pydantic serialization and the
+        # cache lookup entirely
+        self._fastcache: Dict[tuple, tuple] = {}
+
+        # Background prefetch state: futures for speculative generation of
+        # upcoming cues, keyed by (whitespace-normalized) text
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch_futures: Dict[str, Future] = {}
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_tls = threading.local()
         
         if not voice_name and not voice_id:
             logger.warn(
@@ -112,19 +233,20 @@ class ElevenLabsService(SpeechService):
                 "Will be using default voice."
             )
 
-        # Get available voices using the new API
-        try:
-            voices_response = self.client.voices.get_all()
-            available_voices = voices_response.voices
-        except Exception as e:
-            logger.error(f"Failed to get voices: {e}")
-            raise Exception("Failed to get voices from ElevenLabs API.")
+        # Get available voices, preferring the cached list over the API
+        available_voices = self._get_available_voices(
+            api_key, voice_name=voice_name, voice_id=voice_id
+        )
+
+        # Accounts can have hundreds of voices; index once and look up in O(1)
+        voices_by_name = {v.name: v for v in available_voices}
+        voices_by_id = {v.voice_id: v for v in available_voices}
 
         selected_voice = None
         if voice_name:
-            selected_voice = next((v for v in available_voices if v.name == voice_name), None)
+            selected_voice = voices_by_name.get(voice_name)
         elif voice_id:
-            selected_voice = next((v for v in available_voices if v.voice_id == voice_id), None)
+            selected_voice = voices_by_id.get(voice_id)
 
         if selected_voice:
             self.voice_id = selected_voice.voice_id
@@ -140,25 +262,505 @@ class ElevenLabsService(SpeechService):
             else:
                 raise Exception("No voices available from ElevenLabs API.")
             
-        # validate language_code
+        # validate language_code (auto-selection picks a supporting model)
         if language_code:
-            if model not in ["eleven_turbo_v2_5", "eleven_flash_v2_5"]:
+            if model is not None and model not in ["eleven_turbo_v2_5", "eleven_flash_v2_5"]:
                 raise Exception(f"Language code {language_code} is not supported for model {model}. Needs model to be one of ['eleven_turbo_v2_5', 'eleven_flash_v2_5']")
 
         self.model = model
+        self._logged_model_choice = False
         
         # Store voice_settings directly
         self.voice_settings = voice_settings
             
         self.output_format = output_format
+        # PCM is delivered as raw samples; note the rate so it can be
+        # wrapped in a WAV container on disk
+        if output_format.startswith("pcm_"):
+            self._pcm_sample_rate: Optional[int] = int(output_format.split("_")[1])
+        else:
+            self._pcm_sample_rate = None
+        self._audio_suffix = ".wav" if self._pcm_sample_rate is not None else ".mp3"
         self.enable_logging = enable_logging
+
+        if optimize_streaming_latency is None:
+            # Trade a little quality for TTFB on preview renders; keep full
+            # quality for production renders
+            if config.quality in ("low_quality", "medium_quality") or os.getenv(
+                "MANIM_PREVIEW"
+            ):
+                optimize_streaming_latency = 3
+                logger.info(
+                    "Preview quality detected, defaulting to "
+                    "optimize_streaming_latency=3 for lower latency."
+                )
         self.optimize_streaming_latency = optimize_streaming_latency
         self.language_code = language_code
         self.apply_text_normalization = apply_text_normalization
         self.apply_language_text_normalization = apply_language_text_normalization
+        self.stream = stream
+        self.split_sentences = split_sentences
+
+        # Precompute the instance-default portion of the cache key, so
+        # generate_from_text only merges per-request overrides on top.
+        # Pydantic's model_dump() dominates the Python-side cost of the
+        # cache-hit path, so it is done once here and memoized for
+        # per-request VoiceSettings overrides.
+        self._voice_settings_dump_cache: Dict[int, tuple] = {}
+        self._base_voice_settings_dump = (
+            voice_settings.model_dump() if voice_settings else None
+        )
+        self._base_config = {
+            "model": self.model,
+            "voice_id": self.voice_id,
+            "voice_name": self.voice_name,
+            "voice_settings": self._base_voice_settings_dump,
+            "output_format": self.output_format,
+            "enable_logging": self.enable_logging,
+            "optimize_streaming_latency": self.optimize_streaming_latency,
+            "language_code": self.language_code,
+            "seed": None,
+            "previous_text": None,
+            "next_text": None,
+            "previous_request_ids": None,
+            "next_request_ids": None,
+            "apply_text_normalization": self.apply_text_normalization,
+            "apply_language_text_normalization": self.apply_language_text_normalization,
+        }
 
         SpeechService.__init__(self, transcription_model=transcription_model, **kwargs)
 
+    def _get_available_voices(
+        self,
+        api_key: Optional[str],
+        voice_name: Optional[str] = None,
+        voice_id: Optional[str] = None,
+    ) -> list:
+        """Return the available voices, using a per-process and an on-disk
+        cache to skip the ``voices.get_all()`` HTTP call. The API is only hit
+        when the cache is stale or the requested voice is not in it."""
+        key = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()
+        now = time.time()
+
+        cached = _VOICES_CACHE.get(key)
+        if cached is None:
+            cached = self._load_voices_from_disk(key)
+        if cached is not None:
+            timestamp, voices = cached
+            if now - timestamp < _VOICES_CACHE_TTL and self._voices_satisfy(
+                voices, voice_name, voice_id
+            ):
+                _VOICES_CACHE[key] = (timestamp, voices)
+                return voices
+
+        try:
+            voices_response = self.client.voices.get_all()
+        except Exception as e:
+            logger.error(f"Failed to get voices: {e}")
+            raise Exception("Failed to get voices from ElevenLabs API.")
+
+        voices = [
+            _CachedVoice(name=v.name, voice_id=v.voice_id)
+            for v in voices_response.voices
+        ]
+        _VOICES_CACHE[key] = (now, voices)
+        self._save_voices_to_disk(key, now, voices)
+        return voices
+
+    @staticmethod
+    def _voices_satisfy(
+        voices: list, voice_name: Optional[str], voice_id: Optional[str]
+    ) -> bool:
+        if voice_name is not None:
+            return any(v.name == voice_name for v in voices)
+        if voice_id is not None:
+            return any(v.voice_id == voice_id for v in voices)
+        return True
+
+    @staticmethod
+    def _load_voices_from_disk(key: str) -> Optional[Tuple[float, list]]:
+        path = _voices_disk_cache_path()
+        if not os.path.exists(path):
+            return None
+        try:
+            data = json.load(open(path, "r"))
+            entry = data[key]
+            voices = [_CachedVoice(**v) for v in entry["voices"]]
+            return entry["timestamp"], voices
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _save_voices_to_disk(key: str, timestamp: float, voices: list) -> None:
+        path = _voices_disk_cache_path()
+        data = {}
+        if os.path.exists(path):
+            try:
+                data = json.load(open(path, "r"))
+            except ValueError:
+                data = {}
+        data[key] = {
+            "timestamp": timestamp,
+            "voices": [v._asdict() for v in voices],
+        }
+        try:
+            os.makedirs(path.parent, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except OSError as e:
+            logger.warn(f"Could not persist ElevenLabs voice list cache: {e}")
+
+    def prefetch(self, text: str, **kwargs) -> Future:
+        """Speculatively generate a voiceover in a background thread.
+
+        Call this with the text of an upcoming cue while the current one is
+        still animating; the network latency is hidden behind the animation
+        and the subsequent :meth:`generate_from_text` call resolves from the
+        warm cache. Duplicate prefetches of the same text are coalesced.
+
+        Args:
+            text (str): The text to synthesize speech from.
+
+        Returns:
+            Future: The in-flight generation; its result is the usual
+            output data dictionary.
+        """
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="elevenlabs-prefetch"
+            )
+
+        def _run():
+            self._prefetch_tls.active = True
+            try:
+                return self.generate_from_text(text, **kwargs)
+            finally:
+                self._prefetch_tls.active = False
+
+        with self._prefetch_lock:
+            future = self._prefetch_futures.get(text)
+            if future is None:
+                future = self._prefetch_executor.submit(_run)
+                self._prefetch_futures[text] = future
+        return future
+
+    def _select_model(self, input_text: str, language_code: Optional[str]) -> str:
+        """Resolve the model for a request when the user did not pick one.
+        Flash is materially faster and its quality delta is negligible for
+        short cues; it is also required for language enforcement."""
+        if self.model is not None:
+            return self.model
+        if language_code is not None or len(input_text) < 200:
+            selected = "eleven_flash_v2_5"
+        else:
+            selected = "eleven_multilingual_v2"
+        if not self._logged_model_choice:
+            logger.info(f"No model specified, auto-selecting {selected}.")
+            self._logged_model_choice = True
+        return selected
+
+    def _generate_split_sentences(
+        self, sentences: List[str], request_kwargs: dict, full_audio_path: Path
+    ) -> None:
+        """Synthesize sentences concurrently and concatenate the results
+        into a single audio file. Each sub-request gets the surrounding
+        sentences as previous_text/next_text for prosody continuity."""
+        from elevenlabs.client import AsyncElevenLabs
+
+        async def _generate_all():
+            try:
+                async_httpx = httpx.AsyncClient(http2=True, timeout=60)
+            except ImportError:
+                # HTTP/2 support needs the optional `h2` package; HTTP/1.1
+                # falls back to parallel keep-alive connections
+                async_httpx = httpx.AsyncClient(timeout=60)
+            aclient = AsyncElevenLabs(
+                api_key=os.getenv("ELEVEN_API_KEY"), httpx_client=async_httpx
+            )
+
+            async def _generate_one(idx: int, sentence: str):
+                sentence_kwargs = request_kwargs | {
+                    "text": sentence,
+                    "previous_text": " ".join(sentences[:idx])
+                    or request_kwargs.get("previous_text"),
+                    "next_text": " ".join(sentences[idx + 1 :])
+                    or request_kwargs.get("next_text"),
+                }
+                chunks_ = []
+                async for chunk in aclient.text_to_speech.convert(**sentence_kwargs):
+                    chunks_.append(chunk)
+                return b"".join(chunks_)
+
+            try:
+                return await asyncio.gather(
+                    *(
+                        _generate_one(idx, sentence)
+                        for idx, sentence in enumerate(sentences)
+                    )
+                )
+            finally:
+                await async_httpx.aclose()
+
+        parts = asyncio.run(_generate_all())
+
+        if self._pcm_sample_rate is not None:
+            # Raw PCM frames concatenate directly
+            self._write_audio(full_audio_path, b"".join(parts))
+        else:
+            segments = [
+                AudioSegment.from_file(io.BytesIO(part), format="mp3")
+                for part in parts
+            ]
+            combined = segments[0]
+            for segment in segments[1:]:
+                combined += segment
+            tmp_path = full_audio_path.with_name(full_audio_path.name + ".part")
+            combined.export(str(tmp_path), format="mp3")
+            os.replace(tmp_path, full_audio_path)
+
+    def _write_audio(self, path: Path, data: bytes) -> None:
+        """Write assembled audio bytes to disk, wrapping raw PCM in a WAV
+        container so downstream tooling can read duration and sample rate
+        without decoding. The bytes go to a temp file that is moved into
+        place on completion, since a partial file at the digest-named path
+        would count as a cache hit on the next run."""
+        tmp_path = path.with_name(path.name + ".part")
+        if self._pcm_sample_rate is not None:
+            with wave.open(str(tmp_path), "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(self._pcm_sample_rate)
+                wav_file.writeframes(data)
+        else:
+            tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def _build_input_data(
+        self,
+        input_text: str,
+        *,
+        model: Optional[str] = None,
+        voice_settings: Optional[VoiceSettings] = None,
+        enable_logging: Optional[bool] = None,
+        optimize_streaming_latency: Optional[int] = None,
+        language_code: Optional[str] = None,
+        seed: Optional[int] = None,
+        previous_text: Optional[str] = None,
+        next_text: Optional[str] = None,
+        previous_request_ids: Optional[List[str]] = None,
+        next_request_ids: Optional[List[str]] = None,
+        apply_text_normalization: Optional[str] = None,
+        apply_language_text_normalization: Optional[bool] = None,
+    ) -> dict:
+        """Build the dictionary that identifies a request in the cache.
+        All parameters are expected to be already resolved, i.e. per-request
+        overrides applied on top of the instance defaults."""
+        return {
+            "input_text": input_text,
+            "service": "elevenlabs",
+            "config": self._base_config
+            | {
+                "model": model,
+                "voice_settings": self._dump_voice_settings(voice_settings),
+                "enable_logging": enable_logging,
+                "optimize_streaming_latency": optimize_streaming_latency,
+                "language_code": language_code,
+                "seed": seed,
+                "previous_text": previous_text,
+                "next_text": next_text,
+                "previous_request_ids": previous_request_ids,
+                "next_request_ids": next_request_ids,
+                "apply_text_normalization": apply_text_normalization,
+                "apply_language_text_normalization": apply_language_text_normalization,
+            },
+        }
+
+    def get_audio_basename(self, data: dict) -> str:
+        """Name audio files by a digest of the request data, so a cache hit
+        becomes a single stat call instead of a JSON index scan."""
+        if orjson is not None:
+            dumped_data = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        else:
+            dumped_data = json.dumps(data, sort_keys=True).encode("utf-8")
+        return _content_hash(dumped_data).hexdigest()[:32]
+
+    def _dump_voice_settings(
+        self, voice_settings: Optional[VoiceSettings]
+    ) -> Optional[dict]:
+        """Serialize a VoiceSettings instance, reusing the precomputed dump
+        for the instance default and memoizing per-request overrides."""
+        if voice_settings is None:
+            return None
+        if voice_settings is self.voice_settings:
+            return self._base_voice_settings_dump
+        cached = self._voice_settings_dump_cache.get(id(voice_settings))
+        if cached is not None:
+            ref, dump = cached
+            # Guard against id() reuse after the original object was freed
+            if ref() is voice_settings:
+                return dump
+        dump = voice_settings.model_dump()
+        try:
+            self._voice_settings_dump_cache[id(voice_settings)] = (
+                weakref.ref(voice_settings),
+                dump,
+            )
+        except TypeError:
+            pass
+        return dump
+
+    def pregenerate(self, texts: List[str], cache_dir: Optional[str] = None) -> None:
+        """Generate speech for multiple texts concurrently and warm the cache.
+
+        Synchronous wrapper around :meth:`generate_from_text_batch`: all
+        uncached texts are synthesized concurrently over one multiplexed
+        connection, so N cold voiceovers complete in roughly the time of
+        the slowest one instead of N sequential round-trips. Subsequent
+        :meth:`generate_from_text` calls for the same texts (with
+        instance-default settings) will hit the cache.
+
+        Args:
+            texts (List[str]): The texts to synthesize speech from.
+            cache_dir (str, optional): The cache directory to populate.
+                Defaults to the service's cache directory.
+        """
+        try:
+            asyncio.run(self.generate_from_text_batch(texts, cache_dir=cache_dir))
+        except Exception as e:
+            logger.error(f"ElevenLabs TTS pregeneration failed: {e}")
+            raise Exception(f"Failed to pregenerate speech: {e}")
+
+    async def generate_from_text_batch(
+        self, texts: List[str], cache_dir: Optional[str] = None
+    ) -> List[dict]:
+        """Generate speech for multiple texts over one multiplexed connection.
+
+        All requests share a single ``AsyncElevenLabs`` client backed by an
+        HTTP/2 ``httpx.AsyncClient``, so N cues ride one TCP+TLS session
+        (one handshake total) and multiplex at the transport layer instead
+        of opening parallel connections. Cached texts are resolved without
+        a request.
+
+        Args:
+            texts (List[str]): The texts to synthesize speech from.
+            cache_dir (str, optional): The cache directory to populate.
+                Defaults to the service's cache directory.
+
+        Returns:
+            List[dict]: Output data dictionaries, in the same order as
+            ``texts``.
+        """
+        if cache_dir is None:
+            cache_dir = self.cache_dir  # type: ignore
+
+        try:
+            from elevenlabs.client import AsyncElevenLabs
+        except ImportError:
+            logger.error(
+                'Missing packages. Run `pip install "manim-voiceover-plus[elevenlabs]"` '
+                "to use ElevenLabs API."
+            )
+            raise
+
+        results: List[Optional[dict]] = [None] * len(texts)
+        pending = []
+        # Indices that share one pending audio_path; repeated texts ride a
+        # single generation instead of racing two writers on the same file
+        pending_indices: Dict[str, List[int]] = {}
+        for idx, text in enumerate(texts):
+            # Normalize whitespace the same way _wrap_generate_from_text
+            # does, so the warmed entries match the playback lookups
+            text = " ".join(text.split())
+            input_text = remove_bookmarks(text)
+            input_data = self._build_input_data(
+                input_text,
+                model=self._select_model(input_text, self.language_code),
+                voice_settings=self.voice_settings,
+                enable_logging=self.enable_logging,
+                optimize_streaming_latency=self.optimize_streaming_latency,
+                language_code=self.language_code,
+                apply_text_normalization=self.apply_text_normalization,
+                apply_language_text_normalization=self.apply_language_text_normalization,
+            )
+            audio_path = self.get_audio_basename(input_data) + self._audio_suffix
+            entry = {
+                "input_text": text,
+                "input_data": input_data,
+                "original_audio": audio_path,
+            }
+            if (Path(cache_dir) / audio_path).exists():
+                results[idx] = entry
+                continue
+            cached_result = self.get_cached_result(input_data, cache_dir)
+            if cached_result is not None:
+                results[idx] = cached_result
+                continue
+            indices = pending_indices.get(audio_path)
+            if indices is not None:
+                indices.append(idx)
+                continue
+            pending_indices[audio_path] = [idx]
+            pending.append((input_text, entry))
+
+        if not pending:
+            return results
+
+        try:
+            async_httpx = httpx.AsyncClient(http2=True, timeout=60)
+        except ImportError:
+            # HTTP/2 support needs the optional `h2` package; HTTP/1.1
+            # falls back to parallel keep-alive connections
+            async_httpx = httpx.AsyncClient(timeout=60)
+        aclient = AsyncElevenLabs(
+            api_key=os.getenv("ELEVEN_API_KEY"), httpx_client=async_httpx
+        )
+
+        async def _generate_one(input_text: str, entry: dict):
+            chunks_ = []
+            async for chunk in aclient.text_to_speech.convert(
+                text=input_text,
+                voice_id=self.voice_id,
+                model_id=self._select_model(input_text, self.language_code),
+                output_format=self.output_format,
+                voice_settings=self.voice_settings,
+                enable_logging=self.enable_logging,
+                optimize_streaming_latency=self.optimize_streaming_latency,
+                language_code=self.language_code,
+                apply_text_normalization=self.apply_text_normalization,
+                apply_language_text_normalization=self.apply_language_text_normalization,
+            ):
+                chunks_.append(chunk)
+            data = b"".join(chunks_)
+            # Write off the event loop, so the kernel drains the file
+            # while the loop keeps servicing the other TTS streams
+            await asyncio.to_thread(
+                self._write_audio, Path(cache_dir) / entry["original_audio"], data
+            )
+            if self._pcm_sample_rate is not None:
+                # Raw PCM duration is pure arithmetic: bytes / (rate * width)
+                entry["duration"] = len(data) / (self._pcm_sample_rate * 2)
+            else:
+                entry["duration"] = get_duration(
+                    Path(cache_dir) / entry["original_audio"]
+                )
+
+        try:
+            await asyncio.gather(
+                *(_generate_one(input_text, entry) for input_text, entry in pending)
+            )
+        finally:
+            await async_httpx.aclose()
+
+        for _, entry in pending:
+            # Fan the single result out to every index that requested it
+            for idx in pending_indices[entry["original_audio"]]:
+                results[idx] = entry
+            append_to_json_file(
+                Path(cache_dir) / DEFAULT_VOICEOVER_CACHE_JSON_FILENAME, entry
+            )
+
+        return results
+
     def generate_from_text(
         self,
         text: str,
@@ -178,11 +780,58 @@ class ElevenLabsService(SpeechService):
         apply_language_text_normalization: Optional[bool] = None,
         **kwargs,
     ) -> dict:
+        # Fast pre-check on the raw arguments: on repeated renders almost
+        # every call is a hit, so return the memoized result before paying
+        # for bookmark stripping and cache-key construction. Calls with a
+        # text_id are excluded since they mutate consecutive-text state.
+        fastcache_key = None
+        if cache_dir is None and path is None and kwargs.get("text_id") is None:
+            fastcache_key = (
+                text,
+                id(voice_settings) if voice_settings is not None else None,
+                enable_logging,
+                optimize_streaming_latency,
+                language_code,
+                seed,
+                previous_text,
+                next_text,
+                tuple(previous_request_ids) if previous_request_ids else None,
+                tuple(next_request_ids) if next_request_ids else None,
+                apply_text_normalization,
+                apply_language_text_normalization,
+            )
+            hit = self._fastcache.get(fastcache_key)
+            # The entry holds a strong reference to its VoiceSettings, so
+            # an id() match on the same live object cannot be a collision
+            if hit is not None and hit[0] is voice_settings:
+                self._stitch_context = (None, hit[1])
+                return hit[2]
+
         if cache_dir is None:
             cache_dir = self.cache_dir  # type: ignore
 
+        # If a background prefetch of this text is in flight, wait for it
+        # to land in the cache instead of issuing a duplicate request
+        if not getattr(self._prefetch_tls, "active", False):
+            with self._prefetch_lock:
+                prefetch_future = self._prefetch_futures.pop(text, None)
+            if prefetch_future is not None:
+                try:
+                    prefetch_future.result()
+                except Exception:
+                    # Fall through to the regular generation path
+                    pass
+
         input_text = remove_bookmarks(text)
-        
+
+        # Context for ElevenLabs request stitching: the previous cue's
+        # request ID and text let the API reuse conditioning state for
+        # faster, more coherent audio. Request IDs differ between runs, so
+        # the auto-threaded values are applied to the API call only and
+        # kept out of the cache key.
+        chain = self._stitch_context
+        chain_previous_request_id, chain_previous_text = chain or (None, None)
+
         # Extract text_id from kwargs for consecutive text tracking
         text_id = kwargs.get('text_id')
         if text_id is not None:
@@ -208,66 +857,186 @@ class ElevenLabsService(SpeechService):
         final_language_code = language_code or self.language_code
         final_apply_text_normalization = apply_text_normalization or self.apply_text_normalization
         final_apply_language_text_normalization = apply_language_text_normalization if apply_language_text_normalization is not None else self.apply_language_text_normalization
+        final_model = self._select_model(input_text, final_language_code)
 
-        input_data = {
-            "input_text": input_text,
-            "service": "elevenlabs",
-            "config": {
-                "model": self.model,
-                "voice_id": self.voice_id,
-                "voice_name": self.voice_name,
-                "voice_settings": final_voice_settings.model_dump() if final_voice_settings else None,
-                "output_format": self.output_format,
-                "enable_logging": final_enable_logging,
-                "optimize_streaming_latency": final_optimize_streaming_latency,
-                "language_code": final_language_code,
-                "seed": seed,
-                "previous_text": previous_text,
-                "next_text": next_text,
-                "previous_request_ids": previous_request_ids,
-                "next_request_ids": next_request_ids,
-                "apply_text_normalization": final_apply_text_normalization,
-                "apply_language_text_normalization": final_apply_language_text_normalization,
-            },
-        }
-
-        # Check cache
-        cached_result = self.get_cached_result(input_data, cache_dir)
-        if cached_result is not None:
-            return cached_result
+        input_data = self._build_input_data(
+            input_text,
+            model=final_model,
+            voice_settings=final_voice_settings,
+            enable_logging=final_enable_logging,
+            optimize_streaming_latency=final_optimize_streaming_latency,
+            language_code=final_language_code,
+            seed=seed,
+            previous_text=previous_text,
+            next_text=next_text,
+            previous_request_ids=previous_request_ids,
+            next_request_ids=next_request_ids,
+            apply_text_normalization=final_apply_text_normalization,
+            apply_language_text_normalization=final_apply_language_text_normalization,
+        )
 
         if path is None:
-            audio_path = self.get_audio_basename(input_data) + ".mp3"
+            audio_path = self.get_audio_basename(input_data) + self._audio_suffix
         else:
             audio_path = path
 
+        # Content-addressed fast path: the filename is a digest of
+        # input_data, so a hit is a single stat call. The JSON index is
+        # still consulted when a transcription model is set, since word
+        # boundaries only live in the index.
+        if path is None and (Path(cache_dir) / audio_path).exists():
+            cached_result = None
+            if self._whisper_model is not None:
+                cached_result = self.get_cached_result(input_data, cache_dir)
+            if cached_result is None:
+                cached_result = {
+                    "input_text": text,
+                    "input_data": input_data,
+                    "original_audio": audio_path,
+                }
+            if fastcache_key is not None:
+                self._fastcache[fastcache_key] = (
+                    voice_settings,
+                    input_text,
+                    cached_result,
+                )
+            self._stitch_context = (None, input_text)
+            return cached_result
+
+        # Fall back to the JSON index for entries cached before
+        # content-addressed naming
+        cached_result = self.get_cached_result(input_data, cache_dir)
+        if cached_result is not None:
+            if fastcache_key is not None:
+                self._fastcache[fastcache_key] = (
+                    voice_settings,
+                    input_text,
+                    cached_result,
+                )
+            self._stitch_context = (None, input_text)
+            return cached_result
+
         try:
+            if cache_dir is None:
+                raise ValueError("cache_dir cannot be None")
+            full_audio_path = Path(cache_dir) / audio_path
+
+            # Auto-thread the previous request unless the caller provided
+            # explicit stitching context
+            request_previous_text = previous_text
+            if request_previous_text is None and chain_previous_text is not None:
+                request_previous_text = chain_previous_text[-500:]
+            request_previous_request_ids = previous_request_ids
+            if (
+                request_previous_request_ids is None
+                and chain_previous_request_id is not None
+            ):
+                request_previous_request_ids = [chain_previous_request_id]
+
             # Use the new client API for text-to-speech with all available parameters
             # Use per-request overrides if provided, otherwise use instance defaults
-            audio = self.client.text_to_speech.convert(
+            request_kwargs = dict(
                 text=input_text,
                 voice_id=self.voice_id,
-                model_id=self.model,
+                model_id=final_model,
                 output_format=self.output_format,
                 voice_settings=final_voice_settings,
                 enable_logging=final_enable_logging,
                 optimize_streaming_latency=final_optimize_streaming_latency,
                 language_code=final_language_code,
                 seed=seed,
-                previous_text=previous_text,
+                previous_text=request_previous_text,
                 next_text=next_text,
-                previous_request_ids=previous_request_ids,
+                previous_request_ids=request_previous_request_ids,
                 next_request_ids=next_request_ids,
                 apply_text_normalization=final_apply_text_normalization,
                 apply_language_text_normalization=final_apply_language_text_normalization,
             )
-            
-            # Save the audio to file using the correct path
-            if cache_dir is None:
-                raise ValueError("cache_dir cannot be None")
-            full_audio_path = Path(cache_dir) / audio_path
-            save(audio, str(full_audio_path))
-            
+
+            captured_request_id: Optional[str] = None
+            sentences = (
+                _split_sentences(input_text) if self.split_sentences else [input_text]
+            )
+            if len(sentences) > 1:
+                # Synthesize the sentences concurrently; total latency is
+                # roughly that of the longest sentence instead of the sum
+                self._generate_split_sentences(
+                    sentences, request_kwargs, full_audio_path
+                )
+            else:
+
+                def write_chunks(audio_iter):
+                    # Stream into a temp file and move it into place once
+                    # the download completes; an interrupted stream must
+                    # not leave a truncated file at the digest-named path
+                    # where it would count as a cache hit on the next run
+                    tmp_path = full_audio_path.with_name(
+                        full_audio_path.name + ".part"
+                    )
+                    if self._pcm_sample_rate is not None:
+                        with wave.open(str(tmp_path), "wb") as wav_file:
+                            wav_file.setnchannels(1)
+                            wav_file.setsampwidth(2)
+                            wav_file.setframerate(self._pcm_sample_rate)
+                            for chunk in audio_iter:
+                                wav_file.writeframes(chunk)
+                    elif self.stream:
+                        # Stream chunks to disk as they arrive, so generation
+                        # on the server overlaps with local I/O and only one
+                        # chunk is held in memory at a time.
+                        with open(tmp_path, "wb") as f:
+                            for chunk in audio_iter:
+                                f.write(chunk)
+                    else:
+                        # Join the chunks and issue one contiguous write
+                        # instead of one syscall per chunk like
+                        # elevenlabs.save() does
+                        tmp_path.write_bytes(b"".join(audio_iter))
+                    os.replace(tmp_path, full_audio_path)
+
+                # Prefer the raw-response client so the request ID can be
+                # captured for stitching the next cue
+                raw_client = getattr(
+                    self.client.text_to_speech, "with_raw_response", None
+                )
+                with ExitStack() as stack:
+                    raw_response = None
+                    if raw_client is not None:
+                        # Only probing the raw-response interface is
+                        # guarded; once the stream is open, download and
+                        # write errors propagate instead of silently
+                        # re-issuing the request through the fallback
+                        try:
+                            method = (
+                                raw_client.stream
+                                if self.stream
+                                else raw_client.convert
+                            )
+                            raw_response = stack.enter_context(
+                                method(**request_kwargs)
+                            )
+                        except (AttributeError, TypeError):
+                            raw_response = None
+                    if raw_response is not None:
+                        write_chunks(raw_response.data)
+                        headers = getattr(raw_response, "headers", None)
+                        if headers is not None:
+                            request_id = headers.get("request-id")
+                            if request_id:
+                                captured_request_id = request_id
+                    else:
+                        method = (
+                            self.client.text_to_speech.stream
+                            if self.stream
+                            else self.client.text_to_speech.convert
+                        )
+                        write_chunks(method(**request_kwargs))
+
+            # Update the stitching context in one atomic assignment. The
+            # split-sentence path yields several request IDs, none of which
+            # describes the whole cue, so only the text carries over.
+            self._stitch_context = (captured_request_id, input_text)
+
         except Exception as e:
             logger.error(f"ElevenLabs TTS failed: {e}")
             raise Exception(f"Failed to generate speech: {e}")
@@ -276,6 +1045,26 @@ class ElevenLabsService(SpeechService):
             "input_text": text,
             "input_data": input_data,
             "original_audio": audio_path,
+            # Header-parsed duration (no decode), so the tracker can skip
+            # reopening the file
+            "duration": get_duration(full_audio_path),
         }
 
+        if fastcache_key is not None:
+            self._fastcache[fastcache_key] = (voice_settings, input_text, json_dict)
+
         return json_dict
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool and stop the prefetch
+        worker threads."""
+        if getattr(self, "_prefetch_executor", None) is not None:
+            self._prefetch_executor.shutdown(wait=False)
+        if getattr(self, "_httpx_client", None) is not None:
+            self._httpx_client.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
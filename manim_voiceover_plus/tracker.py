@@ -12,6 +12,10 @@ from manim_voiceover_plus.helper import remove_bookmarks
 
 AUDIO_OFFSET_RESOLUTION = 10_000_000
 
+# Precompiled once; _process_bookmarks runs for every voiceover
+_BOOKMARK_SPLIT_RE = re.compile(r"(<bookmark\s*mark\s*=[\'\"]\w*[\"\']\s*/>)")
+_BOOKMARK_MARK_RE = re.compile(r"<bookmark\s*mark\s*=[\'\"](.*)[\"\']\s*/>")
+
 
 class TimeInterpolator:
     def __init__(self, word_boundaries: List[dict]):
@@ -46,7 +50,15 @@ class VoiceoverTracker:
         self.scene = scene
         self.data = data
         self.cache_dir = cache_dir
-        self.duration = get_duration(Path(cache_dir) / self.data["final_audio"])
+        # Use the duration recorded at generation time when the audio was
+        # not post-processed; otherwise parse it from the file header
+        if (
+            "duration" in self.data
+            and self.data.get("final_audio") == self.data.get("original_audio")
+        ):
+            self.duration = self.data["duration"]
+        else:
+            self.duration = get_duration(Path(cache_dir) / self.data["final_audio"])
         # last_t = scene.last_t
         last_t = scene.renderer.time
         if last_t is None:
@@ -105,9 +117,9 @@ class VoiceoverTracker:
 
         # Mark bookmark distances
         # parts = re.split("(<bookmark .*/>)", self.input_text)
-        parts = re.split(r"(<bookmark\s*mark\s*=[\'\"]\w*[\"\']\s*/>)", self.input_text)
+        parts = _BOOKMARK_SPLIT_RE.split(self.input_text)
         for p in parts:
-            matched = re.match(r"<bookmark\s*mark\s*=[\'\"](.*)[\"\']\s*/>", p)
+            matched = _BOOKMARK_MARK_RE.match(p)
             if matched:
                 self.bookmark_distances[matched.group(1)] = len(self.content)
             else:
@@ -133,6 +133,29 @@ class VoiceoverScene(Scene):
     def add_voiceover_ssml(self, ssml: str, **kwargs) -> None:
         raise NotImplementedError("SSML input not implemented yet.")
 
+    def prefetch_voiceover(self, text: str, **kwargs) -> None:
+        """Speculatively generates an upcoming voiceover in the background.
+
+        Call this with the text of the *next* voiceover while the current
+        one is still playing; the speech synthesis then overlaps with the
+        animation and the next :meth:`voiceover` block starts from the warm
+        cache. Does nothing if the speech service does not support
+        prefetching.
+
+        Args:
+            text (str): The text of an upcoming voiceover.
+        """
+        if not hasattr(self, "speech_service"):
+            raise Exception(
+                "You need to call init_voiceover() before adding a voiceover."
+            )
+
+        prefetch = getattr(self.speech_service, "prefetch", None)
+        if prefetch is not None:
+            # Normalize whitespace the same way _wrap_generate_from_text
+            # does, so the prefetched request matches the eventual one
+            prefetch(" ".join(text.split()), **kwargs)
+
     # def save_to_script_file(self, text: str) -> None:
     #     text = " ".join(text.split())
     #     # script_file_path = Path(config.get_dir("output_file")).with_suffix(".script.srt")